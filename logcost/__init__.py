@@ -18,30 +18,61 @@ Docs: https://logcost.io/docs
 
 __version__ = "0.1.0"
 
+import os
+import sys
+
 from .tracker import (
     install,
     export,
     get_stats,
     reset,
+    pause,
+    resume,
     ignore_module,
     start_periodic_flush,
     stop_periodic_flush,
 )
-from .analyzer import CostAnalyzer
-from .exporters import export_csv, export_prometheus, render_html_report
-from .notifiers import (
-    send_slack_notification,
-    send_notification_if_configured,
-)
 
-# Auto-install on import (the magic!)
-install()
+# Analyzer/exporter/notifier symbols resolve lazily (PEP 562) so that a
+# plain `import logcost` in an instrumented app only pays for the tracker.
+_LAZY_IMPORTS = {
+    "CostAnalyzer": "analyzer",
+    "export_csv": "exporters",
+    "export_prometheus": "exporters",
+    "render_html_report": "exporters",
+    "send_slack_notification": "notifiers",
+    "send_notification_if_configured": "notifiers",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+# Auto-install on import (the magic!) — unless explicitly disabled via
+# LOGCOST_AUTOINSTALL=0, or we are the CLI entry point, which only reads
+# stats files and has no logging of its own worth tracking. The basename
+# must match the console-script name exactly; a suffix match would also
+# catch user scripts that merely end in "logcost".
+if os.environ.get("LOGCOST_AUTOINSTALL", "1") != "0" and os.path.basename(
+    sys.argv[0]
+) not in ("logcost", "logcost.exe"):
+    install()
 
 __all__ = [
     "install",
     "export",
     "get_stats",
     "reset",
+    "pause",
+    "resume",
     "ignore_module",
     "start_periodic_flush",
     "stop_periodic_flush",
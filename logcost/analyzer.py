@@ -7,10 +7,18 @@ costs, anti-pattern detections, and ROI estimates.
 
 from __future__ import annotations
 
-import json
+import heapq
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from .utils import decompress_if_gzip, json_loads, stats_from_payload
+
+try:  # Optional acceleration; the analyzer falls back to pure Python without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only on minimal installs
+    np = None
 
 PRICING_PER_GB = {
     "gcp": 0.50,
@@ -21,9 +29,21 @@ PRICING_PER_GB = {
 DEFAULT_LOOP_THRESHOLD = 1000
 DEFAULT_LARGE_MSG_THRESHOLD = 5_000  # bytes per call
 
+# Finding templates live at module scope; %-formatting applies them in one
+# step per flagged row rather than composing nested f-strings in the loop.
+_TMPL_HIGH_VOLUME = "High log volume (%d calls) at %s"
+_TMPL_DEBUG_IN_PROD = "DEBUG log in production at %s costing %.2f %s"
+_TMPL_LARGE_PAYLOAD = "Large log payload (~%d bytes/call) at %s"
+
+
+class CostEntry(NamedTuple):
+    """One analyzed log statement.
+
+    A NamedTuple rather than a dataclass: entries carry no ``__dict__``, so
+    a report over tens of thousands of statements stays compact and the
+    cost-sort touches packed tuples instead of instance dicts.
+    """
 
-@dataclass
-class CostEntry:
     key: str
     file: str
     line: int
@@ -41,6 +61,7 @@ class AnalysisReport:
     currency: str
     total_bytes: int
     total_cost: float
+    total_calls: int
     entries: List[CostEntry]
     top_entries: List[CostEntry]
     anti_patterns: List[str]
@@ -74,10 +95,48 @@ class CostAnalyzer:
         self.provider = provider_key
         self.currency = currency
         self.price_per_gb = price_per_gb
+        # Fold the GiB division into a single multiplier so the per-entry
+        # cost math is one multiply instead of a divide plus multiply.
+        self._cost_per_byte = price_per_gb / (1024 ** 3)
+
+        # Pack counts/bytes into contiguous arrays once so report math runs
+        # as a handful of C-level ndarray ops instead of per-row Python work.
+        self._keys = list(self.stats.keys())
+        self._values = list(self.stats.values())
+        if np is not None:
+            size = len(self._values)
+            self._bytes = np.fromiter(
+                (int(data.get("bytes", 0)) for data in self._values),
+                dtype=np.int64,
+                count=size,
+            )
+            self._count = np.fromiter(
+                (max(int(data.get("count", 0)), 0) for data in self._values),
+                dtype=np.int64,
+                count=size,
+            )
+            self._level_is_debug = np.fromiter(
+                (str(data.get("level", "")).upper() == "DEBUG" for data in self._values),
+                dtype=bool,
+                count=size,
+            )
+        else:
+            self._bytes = None
+            self._count = None
+            self._level_is_debug = None
+
+        # Reports are deterministic for a given top_n, so repeated callers
+        # (analyze + report + estimate on the same stats) share one build.
+        self._report_cache: Dict[int, AnalysisReport] = {}
 
     @staticmethod
     def _load_stats(stats_file: str) -> Dict[str, Dict]:
-        data = json.loads(Path(stats_file).read_text())
+        # Parse straight from the raw bytes: read_text() would decode the
+        # whole file into an intermediate str that the JSON scanner then
+        # walks again, doubling peak memory for large stats files.
+        data = stats_from_payload(
+            json_loads(decompress_if_gzip(Path(stats_file).read_bytes()))
+        )
         if not isinstance(data, dict):
             raise ValueError("Stats file must contain a dictionary")
         return data
@@ -87,7 +146,7 @@ class CostAnalyzer:
             bytes_count = int(data.get("bytes", 0))
             count = max(int(data.get("count", 0)), 0)
             bytes_per_call = bytes_count / count if count else 0.0
-            cost = self._bytes_to_cost(bytes_count)
+            cost = bytes_count * self._cost_per_byte
             yield CostEntry(
                 key=key,
                 file=str(data.get("file", "")),
@@ -100,52 +159,141 @@ class CostAnalyzer:
                 cost=cost,
             )
 
-    def _bytes_to_cost(self, bytes_count: int) -> float:
-        gb = bytes_count / (1024 ** 3)
-        return gb * self.price_per_gb
+    def _compute_arrays(self):
+        """Return vectorized ``(bytes_per_call, cost)`` arrays."""
+        # where= masks zero-count rows so they stay 0.0, matching the
+        # scalar path; plain maximum(count, 1) would report the raw byte
+        # total as the per-call size for such rows.
+        bytes_per_call = np.divide(
+            self._bytes,
+            self._count,
+            out=np.zeros(len(self._values), dtype=np.float64),
+            where=self._count > 0,
+        )
+        cost = self._bytes * self._cost_per_byte
+        return bytes_per_call, cost
+
+    def _make_entry(self, index: int, bytes_per_call: float, cost: float) -> CostEntry:
+        data = self._values[index]
+        return CostEntry(
+            key=self._keys[index],
+            file=str(data.get("file", "")),
+            line=int(data.get("line", 0)),
+            level=str(data.get("level", "")),
+            message_template=str(data.get("message_template", "")),
+            count=max(int(data.get("count", 0)), 0),
+            bytes=int(data.get("bytes", 0)),
+            bytes_per_call=bytes_per_call,
+            cost=cost,
+        )
+
+    def total_cost(self) -> float:
+        """Total estimated cost without building (or sorting) a report."""
+        if np is not None:
+            return float(self._bytes.sum()) * self._cost_per_byte
+        return sum(
+            int(data.get("bytes", 0)) for data in self._values
+        ) * self._cost_per_byte
 
     def build_report(self, top_n: int = 10) -> AnalysisReport:
-        entries = list(self._iter_entries())
-        entries.sort(key=lambda entry: entry.cost, reverse=True)
-        top_entries = entries[:top_n]
-        total_bytes = sum(entry.bytes for entry in entries)
-        total_cost = sum(entry.cost for entry in entries)
-        anti_patterns = self._detect_anti_patterns(entries)
-        recommendations = self._build_recommendations(entries, anti_patterns)
-        return AnalysisReport(
+        cached = self._report_cache.get(top_n)
+        if cached is not None:
+            return cached
+        if np is not None:
+            bytes_per_call, cost = self._compute_arrays()
+            entries = [
+                self._make_entry(i, float(bytes_per_call[i]), float(cost[i]))
+                for i in range(len(self._values))
+            ]
+            # argpartition selects the top_n in O(N); only those few rows
+            # then pay for an actual sort.
+            if top_n >= len(cost):
+                idx = np.argsort(-cost, kind="stable")
+            else:
+                idx = np.argpartition(-cost, top_n)[:top_n]
+                idx = idx[np.argsort(-cost[idx], kind="stable")]
+            top_entries = [entries[i] for i in idx]
+            total_bytes = int(self._bytes.sum())
+            total_cost = float(cost.sum())
+            total_calls = int(self._count.sum())
+            anti_patterns = self._scan_anti_patterns(bytes_per_call, cost)
+        else:
+            # One streaming pass: heapq keeps the top_n (O(N log top_n)
+            # versus a full sort) while the same loop accumulates totals
+            # and flags anti-patterns.
+            entries = list(self._iter_entries())
+            top_entries = heapq.nlargest(top_n, entries, key=attrgetter("cost"))
+            total_bytes = 0
+            total_cost = 0.0
+            total_calls = 0
+            anti_patterns: List[str] = []
+            for entry in entries:
+                total_bytes += entry.bytes
+                total_cost += entry.cost
+                total_calls += entry.count
+                self._flag_anti_patterns(entry, anti_patterns)
+        recommendations = self._build_recommendations(top_entries, anti_patterns)
+        report = AnalysisReport(
             provider=self.provider,
             currency=self.currency,
             total_bytes=total_bytes,
             total_cost=total_cost,
+            total_calls=total_calls,
             entries=entries,
             top_entries=top_entries,
             anti_patterns=anti_patterns,
             recommendations=recommendations,
         )
+        self._report_cache[top_n] = report
+        return report
+
+    def _scan_anti_patterns(self, bytes_per_call, cost) -> List[str]:
+        """Vectorized anti-pattern scan.
+
+        The three threshold checks run as boolean mask ops over the packed
+        arrays; message strings are only formatted for flagged rows.
+        """
+        high = self._count >= DEFAULT_LOOP_THRESHOLD
+        debug = self._level_is_debug & (cost > 0)
+        large = bytes_per_call >= DEFAULT_LARGE_MSG_THRESHOLD
+        flagged = np.nonzero(high | debug | large)[0]
 
-    def _detect_anti_patterns(self, entries: List[CostEntry]) -> List[str]:
         findings: List[str] = []
-        for entry in entries:
-            if entry.count >= DEFAULT_LOOP_THRESHOLD:
-                findings.append(
-                    f"High log volume ({entry.count} calls) at {entry.file}:{entry.line}"
-                )
-            if entry.level.upper() == "DEBUG" and entry.cost > 0:
+        for i in flagged:
+            data = self._values[i]
+            location = f"{data.get('file', '')}:{data.get('line', 0)}"
+            if high[i]:
+                findings.append(_TMPL_HIGH_VOLUME % (self._count[i], location))
+            if debug[i]:
                 findings.append(
-                    f"DEBUG log in production at {entry.file}:{entry.line} costing {entry.cost:.2f} {self.currency}"
-                )
-            if entry.bytes_per_call >= DEFAULT_LARGE_MSG_THRESHOLD:
-                findings.append(
-                    f"Large log payload (~{int(entry.bytes_per_call)} bytes/call) at {entry.file}:{entry.line}"
+                    _TMPL_DEBUG_IN_PROD % (location, cost[i], self.currency)
                 )
+            if large[i]:
+                findings.append(_TMPL_LARGE_PAYLOAD % (bytes_per_call[i], location))
         return findings
 
+    def _flag_anti_patterns(self, entry: CostEntry, findings: List[str]) -> None:
+        if entry.count >= DEFAULT_LOOP_THRESHOLD:
+            findings.append(
+                _TMPL_HIGH_VOLUME % (entry.count, f"{entry.file}:{entry.line}")
+            )
+        if entry.level.upper() == "DEBUG" and entry.cost > 0:
+            findings.append(
+                _TMPL_DEBUG_IN_PROD
+                % (f"{entry.file}:{entry.line}", entry.cost, self.currency)
+            )
+        if entry.bytes_per_call >= DEFAULT_LARGE_MSG_THRESHOLD:
+            findings.append(
+                _TMPL_LARGE_PAYLOAD
+                % (entry.bytes_per_call, f"{entry.file}:{entry.line}")
+            )
+
     def _build_recommendations(
-        self, entries: List[CostEntry], anti_patterns: List[str]
+        self, top_entries: List[CostEntry], anti_patterns: List[str]
     ) -> List[str]:
         recommendations: List[str] = []
-        if entries:
-            heaviest = entries[0]
+        if top_entries:
+            heaviest = top_entries[0]
             recommendations.append(
                 f"Refactor or sample {heaviest.file}:{heaviest.line} "
                 f"({heaviest.message_template[:60]}...) to cut the largest cost contributor."
@@ -168,8 +316,9 @@ class CostAnalyzer:
         if hours_to_fix < 0 or hourly_rate < 0:
             raise ValueError("hours_to_fix and hourly_rate must be non-negative")
 
-        report = self.build_report()
-        potential_savings = report.total_cost * reduction_percent
+        # Only the aggregate cost matters here; skip the report build
+        # (sorting plus entry materialization) entirely.
+        potential_savings = self.total_cost() * reduction_percent
         effort_cost = hours_to_fix * hourly_rate
         net = potential_savings - effort_cost
         roi = (net / effort_cost) if effort_cost else float("inf") if net > 0 else 0.0
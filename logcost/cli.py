@@ -6,26 +6,39 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import zlib
 from pathlib import Path
 from typing import Optional, Sequence
 
 from .analyzer import CostAnalyzer
 from .tracker import export as export_stats
 from .exporters import export_csv, export_prometheus, render_html_report
+from .utils import (
+    decompress_if_gzip,
+    json_dumps_indented,
+    json_loads,
+    stats_from_payload,
+)
 
 
 def _load_stats(path: str) -> dict:
     try:
-        text = Path(path).read_text()
+        # Bytes, not text: skips decoding the file into an intermediate str
+        # before the JSON scanner walks it.
+        raw = Path(path).read_bytes()
     except FileNotFoundError as exc:
         raise RuntimeError(f"Stats file not found: {path}") from exc
     except OSError as exc:
         raise RuntimeError(f"Unable to read stats file {path}: {exc}") from exc
 
     try:
-        return json.loads(text)
+        return stats_from_payload(json_loads(decompress_if_gzip(raw)))
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Failed to parse stats file {path}: {exc}") from exc
+    except (OSError, EOFError, zlib.error) as exc:
+        # gzip.decompress raises BadGzipFile/EOFError/zlib.error for
+        # corrupt or truncated compressed payloads.
+        raise RuntimeError(f"Failed to parse stats file {path}: {exc}") from exc
 
 
 def _cmd_analyze(args: argparse.Namespace) -> int:
@@ -93,18 +106,17 @@ def _cmd_report(args: argparse.Namespace) -> int:
     analysis = analyzer.build_report(top_n=args.top)
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(
-        json.dumps(
+    output_path.write_bytes(
+        json_dumps_indented(
             {
                 "provider": analysis.provider,
                 "currency": analysis.currency,
                 "total_bytes": analysis.total_bytes,
                 "total_cost": analysis.total_cost,
-                "entries": [entry.__dict__ for entry in analysis.entries],
+                "entries": [entry._asdict() for entry in analysis.entries],
                 "anti_patterns": analysis.anti_patterns,
                 "recommendations": analysis.recommendations,
-            },
-            indent=2,
+            }
         )
     )
     print(f"Wrote report to {output_path}")
@@ -130,39 +142,47 @@ def _cmd_estimate(args: argparse.Namespace) -> int:
 def _cmd_diff(args: argparse.Namespace) -> int:
     before = _load_stats(args.stats_file)
     after = _load_stats(args.updated_stats)
-    added = set(after) - set(before)
-    removed = set(before) - set(after)
-    changed = {
-        key: (before[key], after[key])
+    # dict key views support set algebra directly; no intermediate set()
+    # copies of the key spaces are materialized.
+    added = after.keys() - before.keys()
+    removed = before.keys() - after.keys()
+    changed = [
+        (key, before_entry, after_entry)
         for key in before.keys() & after.keys()
+        for before_entry, after_entry in ((before[key], after[key]),)
         if (
-            before[key].get("bytes") != after[key].get("bytes")
-            or before[key].get("count") != after[key].get("count")
+            before_entry.get("bytes") != after_entry.get("bytes")
+            or before_entry.get("count") != after_entry.get("count")
         )
-    }
+    ]
 
     if not (added or removed or changed):
         print("No differences detected.")
         return 0
 
+    # Batch the report into one write: for large diffs, per-line print
+    # calls dominate the runtime of this command.
+    lines = []
     if added:
-        print("Added statements:")
+        lines.append("Added statements:\n")
         for key in added:
             entry = after[key]
-            print(f"  + {key} bytes={entry.get('bytes')} count={entry.get('count')}")
+            lines.append(
+                f"  + {key} bytes={entry.get('bytes')} count={entry.get('count')}\n"
+            )
 
     if removed:
-        print("\nRemoved statements:")
-        for key in removed:
-            print(f"  - {key}")
+        lines.append("\nRemoved statements:\n")
+        lines.extend(f"  - {key}\n" for key in removed)
 
     if changed:
-        print("\nChanged statements:")
-        for key, (before_entry, after_entry) in changed.items():
-            print(
+        lines.append("\nChanged statements:\n")
+        for key, before_entry, after_entry in changed:
+            lines.append(
                 f"  * {key}: bytes {before_entry.get('bytes')} -> {after_entry.get('bytes')}, "
-                f"count {before_entry.get('count')} -> {after_entry.get('count')}"
+                f"count {before_entry.get('count')} -> {after_entry.get('count')}\n"
             )
+    sys.stdout.write("".join(lines))
     return 0
 
 
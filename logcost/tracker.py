@@ -6,10 +6,11 @@ with file/line attribution and byte counting.
 """
 
 import builtins
+import gzip
 import logging
-import inspect
-import json
 import os
+import queue
+import sys
 import tempfile
 import warnings
 import time
@@ -19,17 +20,101 @@ from pathlib import Path
 from threading import Lock, Thread, Event
 from typing import Dict, Optional
 
-from .utils import get_env_int, get_env_int_or_none
+from .utils import (
+    get_env_int,
+    get_env_int_or_none,
+    json_dumps_compact,
+    json_dumps_indented,
+    stats_to_columnar,
+)
 
 PRINT_LEVEL = logging.INFO + 5
 logging.addLevelName(PRINT_LEVEL, "PRINT")
 
+# Tiny local map for the standard levels; getLevelName goes through the
+# logging module's dict plus a "Level %s" fallback format on misses.
+_LEVEL_NAME_CACHE = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    PRINT_LEVEL: "PRINT",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+# Assumed width of formatted numeric args when estimating byte counts.
+_NUMERIC_LEN_ESTIMATE = 20
+
+
+# Sentinel distinguishing "template not analyzed yet" from "analyzed and
+# unsupported" (stored as None) in the sizer cache.
+_UNANALYZED = object()
+
+
+def _analyze_template(template: str):
+    """Return ``(literal_bytes, arg_count)`` for %s-only templates.
+
+    Formatting such a template only ever splices ``str(arg)`` into the
+    literal text, so its byte length is the literal length plus the
+    argument lengths — no %-parsing needed per call. Templates using any
+    other conversion (or no placeholders) return None and keep the normal
+    format path.
+    """
+    n = 0
+    i = 0
+    end = len(template)
+    while True:
+        i = template.find("%", i)
+        if i == -1:
+            break
+        if i + 1 >= end:
+            return None
+        spec = template[i + 1]
+        if spec == "s":
+            n += 1
+        elif spec != "%":
+            return None
+        i += 2
+    if n == 0:
+        return None
+    literal = template % (("",) * n)
+    base = len(literal) if literal.isascii() else len(literal.encode("utf-8"))
+    return (base, n)
+
+
+def _fast_len(arg) -> int:
+    """Cheap formatted-length estimate for one log argument.
+
+    str.isascii() reads a flag on the compact string representation, so
+    the common ASCII case costs nothing extra while non-ASCII strings are
+    measured in UTF-8 bytes rather than code points.
+    """
+    if isinstance(arg, str):
+        return len(arg) if arg.isascii() else len(arg.encode("utf-8"))
+    if isinstance(arg, (bytes, bytearray)):
+        return len(arg)
+    if isinstance(arg, (int, float)):
+        return _NUMERIC_LEN_ESTIMATE
+    return len(str(arg))
+
 
 class LogCostTracker:
-    """Tracks logging costs at runtime with minimal overhead."""
+    """Tracks logging costs at runtime with minimal overhead.
+
+    Concurrency model: each thread accumulates counts into its own pair of
+    dicts, registered once per thread lifetime under ``_lock``; the log hot
+    path itself never takes a lock. Readers (``get_stats``/``export``)
+    merge all registered accumulators under the lock, retrying snapshots
+    that race with a concurrent dict resize.
+    """
 
     def __init__(self):
-        self.stats: Dict[str, Dict] = {}
+        # Hot counters live in flat [count, bytes] lists; the descriptive
+        # fields (file, line, level, template) are written once per key into
+        # a parallel meta dict. Each thread accumulates into its own pair of
+        # dicts (no lock on the log path); readers merge the registered
+        # per-thread dicts under the lock.
+        self._tls_registry: list = []
         self._lock = Lock()
         self._original_log = None
         self._original_print = None
@@ -43,6 +128,60 @@ class LogCostTracker:
         }
         self._max_skip_prefixes = 64
         self._max_stack_depth = 25
+        # Memoizes (id(code), lineno, level) -> (file, line, level_name, key)
+        # so steady-state log calls skip path normalization, level-name
+        # resolution, and key construction entirely.
+        self._frame_cache: Dict = {}
+        self._max_frame_cache = 4096
+        # Memoizes id(code) -> bool for "is this frame logging-internal?";
+        # the prefix/suffix/fragment string scans then run once per unique
+        # code object instead of once per frame visited per log call.
+        self._frame_skip_cache: Dict[int, bool] = {}
+        # level -> resolved tuple for calls whose frame could not be found;
+        # without this the fallback path rebuilt its key string per call.
+        self._unknown_site_cache: Dict = {}
+        # id(code) -> normalized display path, shared across all lines and
+        # levels of a function.
+        self._path_cache: Dict[int, str] = {}
+        # template -> (literal_bytes, arg_count) or None; lets exact mode
+        # size %s-only templates without re-parsing the format string.
+        self._sizer_cache: Dict[str, object] = {}
+        self._rebuild_skip_tuples()
+        # Cached once: Path.cwd() costs a getcwd syscall per call site, and
+        # Path.relative_to raises on the common non-relative case.
+        self._cwd_prefix = os.getcwd() + os.sep
+        # Exact byte counts require formatting every message a second time;
+        # default to cheap length estimation instead.
+        self._exact_bytes = os.getenv("LOGCOST_EXACT_BYTES") == "1"
+        # Levels to never track (numeric); populate to exempt e.g. DEBUG
+        # from tracking overhead entirely.
+        self._track_disabled_levels = frozenset()
+        # Master switch checked first in the installed wrappers; pause()
+        # and resume() flip it so tracking can be suspended without
+        # uninstalling the monkey-patches.
+        self._enabled = True
+        # Calls below this level are logged but not tracked; lets
+        # DEBUG-heavy services opt their spam out of stats overhead.
+        self._min_level = get_env_int("LOGCOST_MIN_LEVEL", 0)
+        # Cardinality cap per thread accumulator: dynamic keys (user IDs,
+        # timestamps leaking past the template) would otherwise grow the
+        # stats dicts without bound. Eviction is insertion-order — hot
+        # statements are inserted early and update in place, so the oldest
+        # key is the cheapest reasonable victim without paying an LRU
+        # reorder on every hit.
+        self._max_keys = get_env_int("LOGCOST_MAX_KEYS", 100_000)
+        self._eviction_warned = False
+        # Opt-in: measure print() payloads on a background thread, so the
+        # calling thread pays only a frame resolution and an enqueue while
+        # the O(total argument length) join happens off-path. Overflow
+        # drops rather than blocks to keep caller latency bounded.
+        self._async_print = os.getenv("LOGCOST_ASYNC_PRINT") == "1"
+        self._print_queue: Optional[queue.Queue] = None
+        self._print_worker: Optional[Thread] = None
+        # Track only every Nth call per thread; counts and bytes are scaled
+        # back up at merge time, trading exactness for a bounded, predictable
+        # per-call overhead on extremely chatty services.
+        self._sample_rate = max(get_env_int("LOGCOST_SAMPLE_RATE", 1), 1)
         # Thread-local storage for caller frame info
         self._thread_local = threading.local()
 
@@ -52,6 +191,9 @@ class LogCostTracker:
         self._max_backups = get_env_int("LOGCOST_MAX_BACKUPS", 5)
         self._flush_thread: Optional[Thread] = None
         self._flush_stop_event = Event()
+        # Rotation backup names, built once per output path.
+        self._rotation_paths: Optional[list] = None
+        self._rotation_paths_for: Optional[str] = None
         self._auto_flush_enabled = False
         self._output_path: Optional[str] = None
         self._notification_interval = get_env_int("LOGCOST_NOTIFICATION_INTERVAL", 3600)
@@ -61,6 +203,18 @@ class LogCostTracker:
         self._notification_test_sent = False
         self._start_time = time.time()
 
+        # Opt-in DEFLATE compression for exports: the stats JSON repeats the
+        # same paths/levels thousands of times and compresses 20-50x. Small
+        # payloads are left alone (gzip overhead is not worth it).
+        self._compress = os.getenv("LOGCOST_COMPRESS") == "1"
+        self._compress_min_size = get_env_int(
+            "LOGCOST_COMPRESS_MIN_SIZE", 256 * 1024
+        )
+        # path -> change token of the last write, so idle flush cycles
+        # (no new log calls since the previous export) skip serialization
+        # and disk I/O entirely.
+        self._export_tokens: Dict[str, tuple] = {}
+
     def install(self):
         """Monkey-patch logging.Logger._log to track calls."""
         if self._installed:
@@ -69,172 +223,440 @@ class LogCostTracker:
         self._original_log = logging.Logger._log
         self._original_findCaller = logging.Logger.findCaller
 
-        # Create a wrapper that properly binds to this tracker instance
+        # Create a wrapper that properly binds to this tracker instance.
+        # The hot callables are captured as closure cells here: cell loads
+        # cost one bytecode each, versus two attribute lookups per call for
+        # ``tracker._original_log`` and friends. ``_track_disabled_levels``
+        # stays an attribute access because callers may reassign it later.
         tracker = self
+        is_enabled_for = logging.Logger.isEnabledFor
+        original_log = self._original_log
+        track_call = self._track_call
+        get_caller_frame = self._get_caller_frame
+        thread_local = self._thread_local
+        frame_is_skipped = self._frame_is_skipped
+        getframe = sys._getframe
+
         def tracked_log_wrapper(logger_self, level, msg, args, **kwargs):
             """Replacement for Logger._log that tracks the call."""
-            # Get the correct caller frame before logging
-            caller_frame = tracker._get_caller_frame()
-
-            # Store caller info in thread-local so findCaller can use it
+            # Skip all tracking work for exempted or disabled levels before
+            # touching the stack. The public logger methods check the level
+            # before reaching _log, so the isEnabledFor guard mainly covers
+            # direct _log()/log() invocations — but it makes the no-emit
+            # path a single int compare either way.
+            if (
+                not tracker._enabled
+                or level < tracker._min_level
+                or level in tracker._track_disabled_levels
+                or not is_enabled_for(logger_self, level)
+            ):
+                return original_log(logger_self, level, msg, args, **kwargs)
+
+            # Fast path: for a plain logger.info()-style call the user frame
+            # sits at a fixed depth — this wrapper (0), the logger method in
+            # logging/__init__.py (1), the caller (2). Grab it in O(1) and
+            # only fall back to the full walk when validation shows extra
+            # frames (Logger.log(), adapters, registered skip modules).
+            try:
+                caller_frame = getframe(2)
+            except ValueError:  # pragma: no cover - no frame at that depth
+                caller_frame = None
+            if caller_frame is not None and frame_is_skipped(caller_frame):
+                caller_frame = get_caller_frame()
+
+            # Store caller info in thread-local so findCaller can use it;
+            # one tuple assignment instead of three attribute writes on the
+            # threading.local's per-thread dict.
             if caller_frame:
-                tracker._thread_local.caller_filename = caller_frame.f_code.co_filename
-                tracker._thread_local.caller_lineno = caller_frame.f_lineno
-                tracker._thread_local.caller_funcname = caller_frame.f_code.co_name
+                code = caller_frame.f_code
+                thread_local.caller = (
+                    code.co_filename,
+                    caller_frame.f_lineno,
+                    code.co_name,
+                )
 
             try:
-                # Track this log call
-                tracker._track_call(level, msg, args)
+                # Track this log call; the frame resolved above is reused so
+                # the stack is never walked twice for one log call.
+                track_call(level, msg, args, caller_frame)
 
                 # Call original logging
-                return tracker._original_log(logger_self, level, msg, args, **kwargs)
+                return original_log(logger_self, level, msg, args, **kwargs)
             finally:
                 # Clear the thread-local data
-                tracker._thread_local.caller_filename = None
-                tracker._thread_local.caller_lineno = None
-                tracker._thread_local.caller_funcname = None
+                thread_local.caller = None
 
         # Override findCaller to use our stored caller info instead of inspecting the stack
         def patched_findCaller(logger_self, stack_info=False, stacklevel=1):
             """Override findCaller to use the correct caller info from LogCost."""
-            # Check if we have cached caller info from LogCost wrapper
-            if (hasattr(tracker._thread_local, 'caller_filename') and
-                tracker._thread_local.caller_filename is not None):
-                filename = tracker._thread_local.caller_filename
-                lineno = tracker._thread_local.caller_lineno
-                funcname = tracker._thread_local.caller_funcname
+            # Cached caller info from the wrapper: a single getattr with a
+            # default replaces the hasattr probe (which raises internally on
+            # first use) plus three separate attribute reads.
+            info = getattr(thread_local, "caller", None)
+            if info is not None:
                 # Return in the format expected by logging module
                 # (filename, lineno, func_name, stack_info_str)
                 sinfo = None
                 if stack_info:
                     sinfo = traceback.format_stack(stack_info)  # pragma: no cover
-                return (filename, lineno, funcname, sinfo)
-            else:
-                # Fall back to original if no cached info
-                return tracker._original_findCaller(logger_self, stack_info=stack_info, stacklevel=stacklevel)
+                return (info[0], info[1], info[2], sinfo)
+            # Fall back to original if no cached info
+            return tracker._original_findCaller(logger_self, stack_info=stack_info, stacklevel=stacklevel)
 
         logging.Logger._log = tracked_log_wrapper
         logging.Logger.findCaller = patched_findCaller
 
         if self._original_print is None:
             self._original_print = builtins.print
+            original_print = self._original_print
+            null_sink_names = ("<null>", os.devnull)
+
+            if self._async_print and self._print_queue is None:
+                self._print_queue = queue.Queue(maxsize=8192)
+                self._print_worker = Thread(
+                    target=self._print_measure_worker, daemon=True
+                )
+                self._print_worker.start()
 
             def tracked_print(*args, **kwargs):
                 """Replacement for builtins.print that tracks the call."""
+                # Paused tracker: one predictable attribute read, then
+                # straight to the real print.
+                if not tracker._enabled:
+                    return original_print(*args, **kwargs)
+                # Null-sink fast path: daemonized services often point stdout
+                # at /dev/null, where the print itself is a no-op but the
+                # str()-and-join below still dominates. Skip building the
+                # message; the per-argument length estimate in _track_call
+                # keeps the call counted.
+                if "file" not in kwargs and (
+                    getattr(sys.stdout, "name", None) in null_sink_names
+                ):
+                    # The message is never built here, so bytes come from
+                    # the per-argument estimator even in exact mode (an
+                    # empty template would %-fail and count zero). The
+                    # first argument's str stands in as the template.
+                    try:
+                        first = args[0] if args else ""
+                        template = first if isinstance(first, str) else str(first)
+                        bytes_count = sum(_fast_len(arg) for arg in args)
+                    except Exception:
+                        template = "<unprintable>"
+                        bytes_count = len(args) * _NUMERIC_LEN_ESTIMATE
+                    site = tracker._resolve_site(get_caller_frame(), PRINT_LEVEL)
+                    tracker._accumulate(site, template, bytes_count)
+                    return original_print(*args, **kwargs)
+
                 sep = kwargs.get("sep", " ")
                 end = kwargs.get("end", "\n")
+
+                # Async mode: resolve the call site here (cheap, cached) but
+                # defer the join and byte counting to the worker thread.
+                print_queue = tracker._print_queue
+                if print_queue is not None:
+                    site = tracker._resolve_site(get_caller_frame(), PRINT_LEVEL)
+                    try:
+                        print_queue.put_nowait((site, args, sep, end))
+                    except queue.Full:
+                        pass  # drop the measurement, never stall the caller
+                    return original_print(*args, **kwargs)
                 try:
                     message = sep.join(str(arg) for arg in args) + end
                 except Exception:
                     message = " ".join(str(arg) for arg in args)
                 # Record as a PRINT level and keep level numeric for consistency
-                self._track_call(PRINT_LEVEL, message, ())
-                return self._original_print(*args, **kwargs)
+                track_call(PRINT_LEVEL, message, ())
+                return original_print(*args, **kwargs)
 
             builtins.print = tracked_print
 
         self._installed = True
 
+    def pause(self):
+        """Suspend tracking while leaving the monkey-patches in place."""
+        self._enabled = False
+
+    def resume(self):
+        """Resume tracking after a pause()."""
+        self._enabled = True
+
     def _get_caller_frame(self):
         """Extract the first frame outside of logging internals.
 
         Returns the frame object or None if not found.
         """
-        frame = inspect.currentframe()
-        caller_frame = None
+        # sys._getframe(1) starts the walk at our caller directly, skipping
+        # the inspect.currentframe() wrapper layer; this runs once per log
+        # call, so hot attributes are bound to locals up front.
+        try:
+            current = sys._getframe(1)
+        except ValueError:  # pragma: no cover - no caller frame
+            return None
+
+        frame_is_skipped = self._frame_is_skipped
+        max_depth = self._max_stack_depth
 
-        # Walk up the stack looking for user code
-        current = frame
         depth = 0
-        while current and depth < self._max_stack_depth:
+        while current is not None and depth < max_depth:
             depth += 1
-            filename = current.f_code.co_filename
-            module_name = current.f_globals.get("__name__", "")
-            skip_logging = any(
-                module_name.startswith(prefix)
-                for prefix in self._skip_module_prefixes
-                if module_name
-            )
-            skip_structures = any(
-                filename.endswith(suffix) or suffix in filename
-                for suffix in self._skip_path_suffixes
-            )
-            if not (skip_logging or skip_structures):
-                caller_frame = current
-                break
+            if not frame_is_skipped(current):
+                return current
             current = current.f_back
 
-        # Avoid reference cycles
-        del frame
-        frame = None
-        del current
-        current = None
+        return None
 
-        return caller_frame
+    def _frame_is_skipped(self, frame) -> bool:
+        """Classify a frame as logging-internal, memoized per code object.
 
-    def _track_call(self, level, msg, args):
-        """Track a single log call."""
-        try:
+        The classification depends only on the code object's filename and
+        module, so the string scans run at most once per unique call site;
+        steady-state checks are a single dict lookup.
+        """
+        cache = self._frame_skip_cache
+        key = id(frame.f_code)
+        skip = cache.get(key)
+        if skip is None:
+            filename = frame.f_code.co_filename
+            # startswith/endswith accept a tuple and walk all candidates in
+            # one C call, replacing the per-suffix Python generator.
+            skip = (
+                frame.f_globals.get("__name__", "").startswith(self._skip_prefix_tuple)
+                or filename.endswith(self._skip_suffix_tuple)
+                or any(fragment in filename for fragment in self._skip_contains_tuple)
+            )
+            if len(cache) >= self._max_frame_cache:
+                cache.clear()
+            cache[key] = skip
+        return skip
+
+    @staticmethod
+    def _level_name(level) -> str:
+        if isinstance(level, str):
+            return level
+        return _LEVEL_NAME_CACHE.get(level) or logging.getLevelName(level)
+
+    def _normalize_path(self, file_path: str) -> str:
+        # Normalize file path against the cached cwd prefix; two string ops
+        # replace Path allocations plus a potential ValueError.
+        if file_path.startswith(self._cwd_prefix):
+            return file_path[len(self._cwd_prefix):]
+        # If not relative to cwd, just use basename
+        return file_path.rsplit(os.sep, 1)[-1]
+
+    def _resolve_call_site(self, caller_frame, level):
+        """Resolve a caller frame to its cached (file, line, level, key) tuple."""
+        code = caller_frame.f_code
+        line_no = caller_frame.f_lineno
+
+        # Normalized paths are shared by every log statement in a function,
+        # so they cache one level coarser than call sites: by code object
+        # alone rather than (code, line, level).
+        code_id = id(code)
+        file_path = self._path_cache.get(code_id)
+        if file_path is None:
+            file_path = self._normalize_path(code.co_filename)
+            if len(self._path_cache) >= self._max_frame_cache:
+                self._path_cache.clear()
+            self._path_cache[code_id] = file_path
+
+        level_name = self._level_name(level)
+        # Aggregate by file:line:level only (not by message content)
+        # This ensures all logs from the same line are counted together.
+        # Interned keys make the per-call stats-dict lookups hit the
+        # identity fast path instead of re-hashing the string.
+        key = sys.intern(f"{file_path}:{line_no}|{level_name}")
+        return file_path, line_no, level_name, key
+
+    def _track_call(self, level, msg, args, caller_frame=None):
+        """Track a single log call.
+
+        ``caller_frame`` may be supplied by a wrapper that already resolved
+        the user frame; direct callers leave it None and pay for the walk.
+        """
+        # Sampling: skip all tracking work for N-1 of every N calls. The
+        # counter lives in thread-local state so the decision stays
+        # lock-free; merged stats are rescaled in get_stats().
+        tls = self._thread_local
+        sample_rate = self._sample_rate
+        if sample_rate > 1:
+            seen = getattr(tls, "sample_counter", 0) + 1
+            tls.sample_counter = seen
+            if seen % sample_rate:
+                return
+
+        # No blanket try/except: exception-block setup is a constant cost on
+        # this hottest-in-the-library path, and the only operations below
+        # that can realistically raise are the str()/%-format calls on user
+        # objects. Those carry their own narrow guards; the frame cache,
+        # key math and dict updates cannot fail on valid interpreter state.
+        if caller_frame is None:
             # Find the first frame outside of logging internals
             caller_frame = self._get_caller_frame()
 
-            if caller_frame:
-                file_path = caller_frame.f_code.co_filename
-                line_no = caller_frame.f_lineno
-            else:
-                file_path = "unknown"
-                line_no = 0
+        site = self._resolve_site(caller_frame, level)
 
-            # Normalize file path
+        # str(msg) can run arbitrary user __str__; resolve it once under a
+        # guard and reuse the result for both counting and the template.
+        if isinstance(msg, str):
+            msg_str = msg
+        else:
             try:
-                file_path = str(Path(file_path).relative_to(Path.cwd()))
-            except ValueError:
-                # If not relative to cwd, just use basename
-                file_path = Path(file_path).name
-
-            # Create tracking key
-            if isinstance(level, str):
-                level_name = level
-            else:
-                level_name = logging.getLevelName(level)
-            # Aggregate by file:line:level only (not by message content)
-            # This ensures all logs from the same line are counted together
-            key = f"{file_path}:{line_no}|{level_name}"
-
-            # Estimate bytes. If there are args, try formatting to capture the
-            # actual serialized size; otherwise fall back to the template string.
+                msg_str = str(msg)
+            except Exception:
+                msg_str = "<unprintable>"
+
+        # Measure bytes. By default the length is estimated from the
+        # template plus each argument so the message is never actually
+        # %-formatted here — logging formats it again anyway, and paying
+        # printf twice per call is the single biggest avoidable cost.
+        # LOGCOST_EXACT_BYTES=1 restores exact formatted sizes.
+        if args and not self._exact_bytes:
+            template_len = (
+                len(msg_str) if msg_str.isascii() else len(msg_str.encode("utf-8"))
+            )
+            try:
+                bytes_count = template_len + sum(_fast_len(a) for a in args)
+            except Exception:
+                # A broken __str__ on an argument; fall back to the flat
+                # per-argument estimate rather than losing the call.
+                bytes_count = template_len + len(args) * _NUMERIC_LEN_ESTIMATE
+        else:
+            bytes_count = -1
             if args:
-                try:
-                    formatted_msg = str(msg) % args
-                except (TypeError, ValueError):
-                    # Intentionally swallow format errors to avoid breaking user
-                    # logging. Emitting a warning would risk recursion (tracker
-                    # logging about itself) and add hot-path overhead; instead
-                    # we fall back to the raw template for a best-effort count.
-                    formatted_msg = str(msg)
-            else:
-                formatted_msg = str(msg)
-
-            bytes_count = len(formatted_msg.encode('utf-8'))
-
-            # Update stats (thread-safe)
+                # %s-only templates (the overwhelmingly common kind) can be
+                # sized exactly without running the format: literal bytes
+                # plus each argument's str() length.
+                sizer = self._sizer_cache.get(msg_str, _UNANALYZED)
+                if sizer is _UNANALYZED:
+                    sizer = _analyze_template(msg_str)
+                    if len(self._sizer_cache) >= self._max_frame_cache:
+                        self._sizer_cache.clear()
+                    self._sizer_cache[msg_str] = sizer
+                if sizer is not None and len(args) == sizer[1]:
+                    try:
+                        total = sizer[0]
+                        for arg in args:
+                            arg_str = arg if isinstance(arg, str) else str(arg)
+                            total += (
+                                len(arg_str)
+                                if arg_str.isascii()
+                                else len(arg_str.encode("utf-8"))
+                            )
+                        bytes_count = total
+                    except Exception:
+                        bytes_count = -1
+
+            if bytes_count < 0:
+                if args:
+                    try:
+                        formatted_msg = msg_str % args
+                    except Exception:
+                        # Intentionally swallow format errors to avoid breaking
+                        # user logging. Emitting a warning would risk recursion
+                        # (tracker logging about itself) and add hot-path
+                        # overhead; instead we fall back to the raw template
+                        # for a best-effort count.
+                        formatted_msg = msg_str
+                else:
+                    formatted_msg = msg_str
+
+                # For ASCII (the norm for backend logs) the UTF-8 byte length
+                # is just the character count; isascii() is a C-level scan, so
+                # the common case skips the transient bytes allocation.
+                if formatted_msg.isascii():
+                    bytes_count = len(formatted_msg)
+                else:
+                    bytes_count = len(formatted_msg.encode('utf-8'))
+
+        self._accumulate(site, msg_str, bytes_count)
+
+    def _resolve_site(self, caller_frame, level):
+        """Return the cached (file, line, level_name, key) for a frame.
+
+        The same (code object, line, level) triple recurs for every hit on
+        a given log statement; it is resolved once and reused. A None frame
+        maps to the per-level "unknown" site.
+        """
+        if caller_frame:
+            cache_key = (id(caller_frame.f_code), caller_frame.f_lineno, level)
+            cached = self._frame_cache.get(cache_key)
+            if cached is None:
+                cached = self._resolve_call_site(caller_frame, level)
+                if len(self._frame_cache) >= self._max_frame_cache:
+                    self._frame_cache.clear()
+                self._frame_cache[cache_key] = cached
+            return cached
+
+        cached = self._unknown_site_cache.get(level)
+        if cached is None:
+            level_name = self._level_name(level)
+            cached = ("unknown", 0, level_name, f"unknown:0|{level_name}")
+            self._unknown_site_cache[level] = cached
+        return cached
+
+    def _accumulate(self, site, msg_str, bytes_count):
+        """Add one measured call to the current thread's accumulator.
+
+        No lock contention with other logging threads — the lock is only
+        taken once per thread lifetime to register the dicts for merging.
+        """
+        file_path, line_no, level_name, key = site
+        tls = self._thread_local
+        counts = getattr(tls, "counts", None)
+        if counts is None:
+            counts = tls.counts = {}
+            meta = tls.meta = {}
             with self._lock:
-                if key not in self.stats:
-                    self.stats[key] = {
-                        "file": file_path,
-                        "line": line_no,
-                        "level": level_name,
-                        "message_template": str(msg),
-                        "count": 0,
-                        "bytes": 0
-                    }
-
-                self.stats[key]["count"] += 1
-                self.stats[key]["bytes"] += bytes_count
-
-        except Exception:
-            # Silently fail to avoid breaking logging
-            pass
+                self._tls_registry.append((counts, meta))
+        else:
+            meta = tls.meta
+
+        entry = counts.get(key)
+        if entry is None:
+            if len(counts) >= self._max_keys:
+                oldest = next(iter(counts))
+                del counts[oldest]
+                del meta[oldest]
+                if not self._eviction_warned:
+                    self._eviction_warned = True
+                    try:
+                        warnings.warn(
+                            "LogCost stats reached LOGCOST_MAX_KEYS "
+                            f"({self._max_keys}); evicting oldest entries. "
+                            "Check for dynamic log messages defeating aggregation.",
+                            RuntimeWarning,
+                        )
+                    except Exception:
+                        # Under -W error the warning raises; it must never
+                        # propagate out of the user's log call or kill the
+                        # async print worker.
+                        pass
+            # meta must be populated before counts: a concurrent get_stats
+            # snapshots counts first and then reads meta, so the reverse
+            # order could expose a key whose metadata does not exist yet.
+            meta[key] = (file_path, line_no, level_name, msg_str)
+            counts[key] = [1, bytes_count]
+        else:
+            entry[0] += 1
+            entry[1] += bytes_count
+
+    def _print_measure_worker(self):
+        """Consume deferred print measurements from the bounded queue."""
+        q = self._print_queue
+        while True:
+            site, args, sep, end = q.get()
+            try:
+                try:
+                    message = sep.join(str(arg) for arg in args) + end
+                except Exception:
+                    message = " ".join(str(arg) for arg in args)
+                if message.isascii():
+                    bytes_count = len(message)
+                else:
+                    bytes_count = len(message.encode("utf-8"))
+                self._accumulate(site, message, bytes_count)
+            finally:
+                q.task_done()
 
     def export(self, output_path: Optional[str] = None) -> str:
         """Export collected stats to JSON file."""
@@ -244,25 +666,71 @@ class LogCostTracker:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with self._lock:
-            stats_copy = dict(self.stats)
+        stats_copy = self.get_stats()
+
+        # A periodic flush on an idle service would rewrite an identical
+        # file every cycle. The token is a cheap digest of the stats plus
+        # the format toggles; when it matches the last write to this path,
+        # the on-disk file is already current.
+        pretty = os.getenv("LOGCOST_PRETTY") == "1"
+        columnar = os.getenv("LOGCOST_COLUMNAR") == "1"
+        token = (
+            len(stats_copy),
+            sum(entry["count"] for entry in stats_copy.values()),
+            sum(entry["bytes"] for entry in stats_copy.values()),
+            pretty,
+            columnar,
+            self._compress,
+        )
+        token_key = str(output_file)
+        if self._export_tokens.get(token_key) == token:
+            if self._compress:
+                compressed = Path(token_key + ".gz")
+                if compressed.exists():
+                    return str(compressed)
+            if output_file.exists():
+                return str(output_file)
+
+        # Columnar layout drops the repeated per-row field names; readers
+        # normalize it back via stats_from_payload.
+        if columnar:
+            stats_copy = stats_to_columnar(stats_copy)
+
+        # Compact JSON halves the output size and serialization time versus
+        # indent=2; set LOGCOST_PRETTY=1 for human-readable files.
+        if pretty:
+            payload = json_dumps_indented(stats_copy)
+        else:
+            payload = json_dumps_compact(stats_copy)
+
+        if self._compress and len(payload) >= self._compress_min_size:
+            # Level 1 keeps the encode fast; readers sniff the gzip magic.
+            payload = gzip.compress(payload, compresslevel=1)
+            output_file = Path(str(output_file) + ".gz")
 
         temp_path: Optional[Path] = None
         try:
             with tempfile.NamedTemporaryFile(
-                mode='w',
+                mode='wb',
                 delete=False,
                 dir=str(output_file.parent),
                 prefix=output_file.name,
                 suffix=".tmp"
             ) as tmp_file:
-                json.dump(stats_copy, tmp_file, indent=2)
+                tmp_file.write(payload)
                 tmp_file.flush()
-                os.fsync(tmp_file.fileno())
+                # fsync is a full disk barrier that can stall for hundreds
+                # of ms on a busy host — painful at atexit. The stats file
+                # is rewritten every export, so flush + atomic rename is
+                # durable enough; LOGCOST_FSYNC=1 restores the barrier for
+                # deployments that must survive power loss.
+                if os.getenv("LOGCOST_FSYNC") == "1":
+                    os.fsync(tmp_file.fileno())
                 temp_path = Path(tmp_file.name)
 
             temp_path.replace(output_file)
             temp_path = None
+            self._export_tokens[token_key] = token
         finally:
             if temp_path and temp_path.exists():
                 temp_path.unlink(missing_ok=True)
@@ -270,14 +738,90 @@ class LogCostTracker:
         return str(output_file)
 
     def get_stats(self) -> Dict:
-        """Get current stats (thread-safe copy)."""
+        """Get current stats (thread-safe merged copy).
+
+        Merges every thread's accumulator and materializes the public
+        dict-of-dicts layout.
+        """
+        # Deferred print measurements must land before the merge.
+        if self._print_queue is not None:
+            self._print_queue.join()
+
+        # With sampling active each recorded hit stands in for N calls.
+        scale = self._sample_rate
+        stats: Dict[str, Dict] = {}
         with self._lock:
-            return dict(self.stats)
+            for counts, meta in self._tls_registry:
+                items = self._snapshot_items(counts)
+                for key, entry in items:
+                    merged = stats.get(key)
+                    if merged is None:
+                        info = meta.get(key)
+                        if info is None:
+                            # The writer evicted this key between our counts
+                            # snapshot and now; the entry is gone either way.
+                            continue
+                        stats[key] = {
+                            "file": info[0],
+                            "line": info[1],
+                            "level": info[2],
+                            "message_template": info[3],
+                            "count": entry[0] * scale,
+                            "bytes": entry[1] * scale,
+                        }
+                    else:
+                        merged["count"] += entry[0] * scale
+                        merged["bytes"] += entry[1] * scale
+        return stats
+
+    @staticmethod
+    def _snapshot_items(counts: Dict) -> list:
+        # Writer threads insert without a lock, so a concurrent resize can
+        # interrupt iteration; retry until a consistent snapshot is taken.
+        while True:
+            try:
+                return list(counts.items())
+            except RuntimeError:  # pragma: no cover - needs a mid-copy resize
+                continue
 
     def reset(self):
         """Clear all collected stats."""
         with self._lock:
-            self.stats.clear()
+            for counts, meta in self._tls_registry:
+                counts.clear()
+                meta.clear()
+        # Derived report caches keyed on stats identity are stale now.
+        notifiers = sys.modules.get("logcost.notifiers")
+        if notifiers is not None:
+            notifiers._REPORT_CACHE.clear()
+
+    def _rebuild_skip_tuples(self):
+        """Precompile the skip sets into tuples for C-level matching.
+
+        Path-like entries (containing a separator) become endswith
+        candidates; bare fragments like ``importlib`` keep substring
+        matching.
+        """
+        self._skip_prefix_tuple = tuple(self._skip_module_prefixes)
+        self._skip_suffix_tuple = tuple(
+            s for s in self._skip_path_suffixes if "/" in s or os.sep in s
+        )
+        self._skip_contains_tuple = tuple(
+            s for s in self._skip_path_suffixes if "/" not in s and os.sep not in s
+        )
+        # Cached per-code-object classifications were made against the old
+        # tuples and may now be wrong in either direction.
+        self._frame_skip_cache.clear()
+
+    def refresh_cwd(self):
+        """Re-read the working directory used for path normalization.
+
+        Call after os.chdir() if relative attribution should follow the
+        new directory; cached call-site entries are dropped too.
+        """
+        self._cwd_prefix = os.getcwd() + os.sep
+        self._frame_cache.clear()
+        self._path_cache.clear()
 
     def add_skip_module(self, module_prefix: str):
         """Skip module prefixes when determining the caller."""
@@ -293,6 +837,7 @@ class LogCostTracker:
             )
             return
         self._skip_module_prefixes.add(module_prefix)
+        self._rebuild_skip_tuples()
 
     def _send_notification_if_configured(self, test_notification: bool = False):
         """Send notification if webhook is configured via environment variable."""
@@ -309,34 +854,43 @@ class LogCostTracker:
 
     def _rotate_file(self, output_path: str):
         """Rotate log file if it exceeds max size."""
-        output_file = Path(output_path)
-        if not output_file.exists():
+        try:
+            file_size = os.path.getsize(output_path)
+        except OSError:
             return
 
-        file_size = output_file.stat().st_size
         if file_size < self._max_file_size:
             return
 
+        # Backup names are stable per output path; build the string list
+        # once instead of allocating Path objects every rotation check.
+        if self._rotation_paths_for != output_path:
+            self._rotation_paths = [output_path] + [
+                f"{output_path}.{i}" for i in range(1, self._max_backups + 1)
+            ]
+            self._rotation_paths_for = output_path
+        paths = self._rotation_paths
+
         # Rotate: file.json -> file.json.1, file.json.1 -> file.json.2, etc.
+        # os.replace overwrites atomically, replacing the per-step
+        # exists/unlink/rename triple with a single syscall.
         for i in range(self._max_backups - 1, 0, -1):
-            old_backup = Path(f"{output_path}.{i}")
-            new_backup = Path(f"{output_path}.{i + 1}")
-            if old_backup.exists():
-                if new_backup.exists():
-                    new_backup.unlink()
-                old_backup.rename(new_backup)
+            if os.path.exists(paths[i]):
+                os.replace(paths[i], paths[i + 1])
 
         # Move current file to .1
-        backup = Path(f"{output_path}.1")
-        if backup.exists():
-            backup.unlink()
-        output_file.rename(backup)
+        os.replace(output_path, paths[1])
 
     def _periodic_flush_worker(self):
         """Background worker that periodically flushes stats to disk."""
         while not self._flush_stop_event.wait(self._flush_interval):
             try:
                 if self._output_path and self._installed:
+                    # Pick up os.chdir() between cycles so relative path
+                    # attribution stays correct; one getcwd per cycle, and
+                    # caches are only dropped when it actually changed.
+                    if os.getcwd() + os.sep != self._cwd_prefix:
+                        self.refresh_cwd()
                     self._rotate_file(self._output_path)
                     self.export(self._output_path)
 
@@ -427,6 +981,16 @@ def reset():
     _tracker.reset()
 
 
+def pause():
+    """Suspend tracking while leaving the monkey-patches in place."""
+    _tracker.pause()
+
+
+def resume():
+    """Resume tracking after a pause()."""
+    _tracker.resume()
+
+
 def ignore_module(module_prefix: str):
     """Skip the given module prefix when attributing log calls."""
     _tracker.add_skip_module(module_prefix)
@@ -1,6 +1,76 @@
+import gzip
+import json
 import os
 import warnings
-from typing import Optional
+from typing import Any, Optional, Union
+
+try:  # Optional acceleration; JSON helpers fall back to stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only on minimal installs
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decompress_if_gzip(raw: bytes) -> bytes:
+    """Transparently inflate gzip-compressed stats payloads."""
+    if raw[:2] == b"\x1f\x8b":
+        return gzip.decompress(raw)
+    return raw
+
+
+_STATS_SCHEMA = ["file", "line", "level", "message_template", "count", "bytes"]
+
+
+def stats_to_columnar(stats: dict) -> dict:
+    """Convert dict-of-dicts stats to the compact schema/rows layout.
+
+    Field names dominate the serialized size of small entries; emitting
+    them once as a schema header shrinks the payload by roughly a third.
+    """
+    return {
+        "schema": _STATS_SCHEMA,
+        "rows": [
+            [entry.get(field) for field in _STATS_SCHEMA]
+            for entry in stats.values()
+        ],
+    }
+
+
+def stats_from_payload(data: Any) -> Any:
+    """Normalize a parsed stats payload to the dict-of-dicts layout.
+
+    Accepts both the classic keyed layout and the columnar schema/rows
+    layout; statement keys are reconstructed as ``file:line|level``.
+    """
+    if not (isinstance(data, dict) and "schema" in data and "rows" in data):
+        return data
+    schema = data["schema"]
+    stats = {}
+    for row in data["rows"]:
+        entry = dict(zip(schema, row))
+        key = f"{entry.get('file', '')}:{entry.get('line', 0)}|{entry.get('level', '')}"
+        stats[key] = entry
+    return stats
+
+
+def json_dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space-indented JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 def get_env_int(name: str, default: int) -> int:
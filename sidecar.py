@@ -28,7 +28,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional
 
-from logcost.utils import get_env_int
+from logcost.utils import (
+    decompress_if_gzip,
+    get_env_int,
+    json_dumps_indented,
+    json_loads,
+    stats_from_payload,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -67,8 +73,9 @@ class LogCostSidecar:
                 logger.debug(f"Stats file not found: {self.watch_path}")
                 return None
 
-            with open(self.watch_path, 'r') as f:
-                stats = json.load(f)
+            stats = stats_from_payload(
+                json_loads(decompress_if_gzip(self.watch_path.read_bytes()))
+            )
 
             logger.info(f"Loaded stats: {len(stats)} unique log statements")
             return stats
@@ -83,24 +90,47 @@ class LogCostSidecar:
         """Save historical snapshot for trend analysis."""
         try:
             snapshot_file = self.history_dir / f"snapshot_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-            with open(snapshot_file, 'w') as f:
-                json.dump(stats, f, indent=2)
+            # json_dumps_indented uses orjson's C encoder when available and
+            # writes one bytes payload instead of streaming through the
+            # stdlib pretty printer.
+            snapshot_file.write_bytes(json_dumps_indented(stats))
             logger.info(f"Saved snapshot: {snapshot_file.name}")
         except Exception as e:
             logger.error(f"Failed to save snapshot: {e}")
 
-    def load_previous_snapshot(self) -> Optional[Dict]:
+    def list_snapshots(self) -> list:
+        """List snapshot filenames once, sorted oldest-first.
+
+        The timestamp in the name makes lexicographic order chronological,
+        so one os.scandir pass serves every consumer in a cycle instead of
+        each method re-globbing (and re-statting) the directory.
+        """
+        try:
+            with os.scandir(self.history_dir) as entries:
+                return sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith("snapshot_")
+                    and entry.name.endswith(".json")
+                )
+        except OSError as e:
+            logger.error(f"Failed to list snapshots: {e}")
+            return []
+
+    def load_previous_snapshot(self, snapshots: Optional[list] = None) -> Optional[Dict]:
         """Load the most recent historical snapshot for comparison."""
         try:
-            snapshots = sorted(self.history_dir.glob("snapshot_*.json"))
+            if snapshots is None:
+                snapshots = self.list_snapshots()
             if len(snapshots) < 2:
                 # Need at least 2 snapshots for comparison (current saved + previous)
                 return None
 
             # Get second-to-last snapshot (last one is current)
-            prev_snapshot = snapshots[-2]
-            with open(prev_snapshot, 'r') as f:
-                stats = json.load(f)
+            prev_snapshot = self.history_dir / snapshots[-2]
+            # Parse straight from bytes: no text decode pass, and orjson's
+            # C parser is used when the speed extra is installed.
+            stats = json_loads(prev_snapshot.read_bytes())
 
             logger.info(f"Loaded previous snapshot: {prev_snapshot.name}")
             return stats
@@ -108,22 +138,29 @@ class LogCostSidecar:
             logger.error(f"Failed to load previous snapshot: {e}")
             return None
 
-    def cleanup_old_snapshots(self):
+    def cleanup_old_snapshots(self, snapshots: Optional[list] = None):
         """Remove snapshots older than retention period."""
         try:
             cutoff = datetime.now() - timedelta(days=self.history_retention_days)
 
-            for snapshot_file in self.history_dir.glob("snapshot_*.json"):
+            if snapshots is None:
+                snapshots = self.list_snapshots()
+            for name in snapshots:
                 # Parse timestamp from filename: snapshot_YYYYMMDD_HHMMSS.json
                 try:
-                    timestamp_str = snapshot_file.stem.split('_', 1)[1]
+                    timestamp_str = name[len("snapshot_"):-len(".json")]
                     snapshot_time = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
+                except ValueError:
+                    logger.warning(f"Could not parse snapshot timestamp: {name}")
+                    continue
 
-                    if snapshot_time < cutoff:
-                        snapshot_file.unlink()
-                        logger.info(f"Deleted old snapshot: {snapshot_file.name}")
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Could not parse snapshot timestamp: {snapshot_file.name}")
+                if snapshot_time < cutoff:
+                    os.unlink(self.history_dir / name)
+                    logger.info(f"Deleted old snapshot: {name}")
+                else:
+                    # Names sort chronologically; everything after the first
+                    # retained snapshot is newer still.
+                    break
         except Exception as e:
             logger.error(f"Error during snapshot cleanup: {e}")
 
@@ -167,14 +204,17 @@ class LogCostSidecar:
                     # Save snapshot for future trend analysis
                     self.save_snapshot(stats, timestamp)
 
+                    # One directory listing serves the whole cycle
+                    snapshots = self.list_snapshots()
+
                     # Load previous snapshot for comparison
-                    previous_stats = self.load_previous_snapshot()
+                    previous_stats = self.load_previous_snapshot(snapshots)
 
                     # Send notification
                     self.send_notification(stats, previous_stats)
 
                     # Cleanup old snapshots
-                    self.cleanup_old_snapshots()
+                    self.cleanup_old_snapshots(snapshots)
                 else:
                     logger.debug("No stats available yet, waiting...")
 
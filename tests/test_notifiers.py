@@ -32,6 +32,7 @@ def test_send_slack_notification_success(monkeypatch):
         captured["data"] = json.loads(request.data.decode("utf-8"))
         return DummyResponse(status=200)
 
+    monkeypatch.setattr(notifiers, "_POOL", None)
     monkeypatch.setattr(notifiers.request, "urlopen", fake_urlopen)
 
     ok = notifiers.send_slack_notification(
@@ -46,10 +47,32 @@ def test_send_slack_notification_success(monkeypatch):
     assert "blocks" in captured["data"]
 
 
+def test_send_slack_notification_uses_pool(monkeypatch):
+    sent = {}
+
+    class FakePool:
+        def request(self, method, url, body=None, headers=None, timeout=None):
+            sent["method"] = method
+            sent["url"] = url
+            sent["data"] = json.loads(body.decode("utf-8"))
+            return SimpleNamespace(status=200)
+
+    monkeypatch.setattr(notifiers, "_POOL", FakePool())
+
+    ok = notifiers.send_slack_notification(
+        "https://hooks.slack.com/services/test", _sample_stats()
+    )
+
+    assert ok is True
+    assert sent["method"] == "POST"
+    assert "blocks" in sent["data"]
+
+
 def test_send_slack_notification_failure(monkeypatch):
     def fake_urlopen(*_, **__):
         raise notifiers.urllib_error.URLError("boom")
 
+    monkeypatch.setattr(notifiers, "_POOL", None)
     monkeypatch.setattr(notifiers.request, "urlopen", fake_urlopen)
     ok = notifiers.send_slack_notification("https://hooks.slack.com/services/test", _sample_stats())
     assert ok is False
@@ -34,7 +34,8 @@ def test_track_call_finds_user_frame():
     assert entry["line"] > 0
 
 
-def test_track_call_counts_and_bytes():
+def test_track_call_counts_and_bytes(monkeypatch):
+    monkeypatch.setenv("LOGCOST_EXACT_BYTES", "1")
     tracker = LogCostTracker()
     for _ in range(2):
         tracker._track_call(logging.WARNING, "hello %s", ("world",))
@@ -46,7 +47,30 @@ def test_track_call_counts_and_bytes():
     assert entry["message_template"] == "hello %s"
 
 
-def test_track_call_handles_format_errors():
+def test_track_call_exact_bytes_for_percent_s_template(monkeypatch):
+    monkeypatch.setenv("LOGCOST_EXACT_BYTES", "1")
+    tracker = LogCostTracker()
+    tracker._track_call(logging.INFO, "n=%s", (1234,))
+
+    entry = next(iter(tracker.get_stats().values()))
+    # %s-only templates are sized via the cached sizer without formatting;
+    # the result must match the formatted length exactly.
+    assert entry["bytes"] == len("n=1234")
+
+
+def test_track_call_estimates_bytes_by_default():
+    tracker = LogCostTracker()
+    tracker._track_call(logging.WARNING, "hello %s", ("world",))
+
+    entry = next(iter(tracker.get_stats().values()))
+    assert entry["count"] == 1
+    # Default mode never formats the message; bytes are the template
+    # length plus a per-argument estimate.
+    assert entry["bytes"] == len("hello %s") + len("world")
+
+
+def test_track_call_handles_format_errors(monkeypatch):
+    monkeypatch.setenv("LOGCOST_EXACT_BYTES", "1")
     tracker = LogCostTracker()
     tracker._track_call(logging.INFO, "value: %s %s", ("only_one",))
 
@@ -93,6 +117,55 @@ def test_export_respects_env_var(tmp_path, monkeypatch):
     assert env_path.exists()
 
 
+def test_export_skips_rewrite_when_unchanged(tmp_path):
+    tracker = LogCostTracker()
+    tracker._track_call(logging.INFO, "steady", ())
+
+    output_path = tmp_path / "stats.json"
+    exported = tracker.export(str(output_path))
+    first_mtime = Path(exported).stat().st_mtime_ns
+
+    # No new calls: the flush cycle should leave the file untouched.
+    assert tracker.export(str(output_path)) == exported
+    assert Path(exported).stat().st_mtime_ns == first_mtime
+
+    tracker._track_call(logging.INFO, "steady", ())
+    tracker.export(str(output_path))
+    assert Path(exported).stat().st_mtime_ns != first_mtime
+
+
+def test_export_compressed(tmp_path, monkeypatch):
+    import gzip
+
+    monkeypatch.setenv("LOGCOST_COMPRESS", "1")
+    monkeypatch.setenv("LOGCOST_COMPRESS_MIN_SIZE", "0")
+    tracker = LogCostTracker()
+    tracker._track_call(logging.INFO, "compressed msg", ())
+
+    exported = tracker.export(str(tmp_path / "stats.json"))
+    assert exported.endswith(".json.gz")
+    data = json.loads(gzip.decompress(Path(exported).read_bytes()))
+    assert data
+
+
+def test_export_columnar_round_trip(tmp_path, monkeypatch):
+    from logcost.utils import stats_from_payload
+
+    monkeypatch.setenv("LOGCOST_COLUMNAR", "1")
+    tracker = LogCostTracker()
+    tracker._track_call(logging.INFO, "columnar msg", ())
+
+    exported = tracker.export(str(tmp_path / "stats.json"))
+    payload = json.loads(Path(exported).read_text())
+    assert payload["schema"][0] == "file"
+    assert len(payload["rows"]) == 1
+
+    stats = stats_from_payload(payload)
+    entry = next(iter(stats.values()))
+    assert entry["message_template"] == "columnar msg"
+    assert entry["count"] == 1
+
+
 def test_install_monkeypatches_logging(restore_monkey_patches):
     tracker = LogCostTracker()
     original_log = logging.Logger._log
@@ -140,6 +213,36 @@ def test_thread_safe_tracking():
     assert entry["count"] == total_threads * per_thread
 
 
+def test_pause_and_resume(restore_monkey_patches, capsys):
+    tracker = LogCostTracker()
+    tracker.install()
+    logger = logging.getLogger("logcost-pause-test")
+
+    tracker.pause()
+    logger.warning("not tracked")
+    print("not tracked either")
+    assert tracker.get_stats() == {}
+
+    tracker.resume()
+    logger.warning("tracked")
+    assert len(tracker.get_stats()) == 1
+
+
+def test_min_level_skips_tracking(restore_monkey_patches, monkeypatch):
+    monkeypatch.setenv("LOGCOST_MIN_LEVEL", str(logging.WARNING))
+    tracker = LogCostTracker()
+    tracker.install()
+    logger = logging.getLogger("logcost-min-level-test")
+    logger.setLevel(logging.DEBUG)
+
+    logger.info("below threshold")
+    logger.warning("at threshold")
+
+    stats = tracker.get_stats()
+    assert len(stats) == 1
+    assert next(iter(stats.values()))["level"] == "WARNING"
+
+
 def test_print_statements_tracked(restore_monkey_patches):
     tracker = LogCostTracker()
     tracker.install()
@@ -152,6 +255,39 @@ def test_print_statements_tracked(restore_monkey_patches):
     assert "print-test|123" in entry["message_template"]
 
 
+def test_print_async_measurement(restore_monkey_patches, monkeypatch):
+    monkeypatch.setenv("LOGCOST_ASYNC_PRINT", "1")
+    tracker = LogCostTracker()
+    tracker.install()
+
+    print("async-print", 7, sep="|", end="")
+
+    # get_stats drains the measurement queue before merging.
+    entry = next(iter(tracker.get_stats().values()))
+    assert entry["level"] == "PRINT"
+    assert entry["count"] == 1
+    assert "async-print|7" in entry["message_template"]
+
+
+def test_print_null_stdout_skips_message_build(restore_monkey_patches, monkeypatch):
+    import os
+    import sys
+
+    tracker = LogCostTracker()
+    tracker.install()
+
+    with open(os.devnull, "w") as devnull:
+        monkeypatch.setattr(sys, "stdout", devnull)
+        print("discarded", "output")
+
+    entry = next(iter(tracker.get_stats().values()))
+    assert entry["level"] == "PRINT"
+    assert entry["count"] == 1
+    # The message is never joined on the null-sink path; bytes come from
+    # the per-argument estimate.
+    assert entry["bytes"] == len("discarded") + len("output")
+
+
 def test_skip_module_prefix_finds_real_caller():
     tracker = LogCostTracker()
 
@@ -177,6 +313,32 @@ def test_skip_module_limit(monkeypatch):
     assert len(tracker._skip_module_prefixes) == 2
 
 
+def test_sample_rate_scales_counts():
+    tracker = LogCostTracker()
+    tracker._sample_rate = 4
+    for _ in range(8):
+        tracker._track_call(logging.INFO, "sampled", ())
+
+    entry = next(iter(tracker.get_stats().values()))
+    # Two of eight calls are recorded; counts are rescaled on merge.
+    assert entry["count"] == 8
+
+
+def test_max_keys_evicts_oldest_entry():
+    tracker = LogCostTracker()
+    tracker._max_keys = 2
+    # Keys aggregate on file:line|level, so distinct levels from the same
+    # line produce distinct keys.
+    with pytest.warns(RuntimeWarning):
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR):
+            tracker._track_call(level, "msg", ())
+
+    stats = tracker.get_stats()
+    assert len(stats) == 2
+    levels = {entry["level"] for entry in stats.values()}
+    assert levels == {"WARNING", "ERROR"}
+
+
 def test_stack_depth_limit_results_in_unknown_file():
     tracker = LogCostTracker()
     tracker._max_stack_depth = 1